@@ -2,114 +2,259 @@
 
 from __future__ import annotations
 
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING, Final
 
-# flext-core imports
-from flext_core import FlextExceptions, FlextResult, FlextModels, FlextLogger
+if TYPE_CHECKING:
+    # flext-core imports
+    from flext_core import FlextExceptions, FlextLogger, FlextModels, FlextResult
 
-# === FLEXT-MELTANO INTEGRATION ===
-# Re-export available flext-meltano facilities
-from flext_meltano import (
-    # Bridge integration
-    FlextMeltanoBridge,
-    # Configuration and validation
-    FlextMeltanoConfig,
-    # Enterprise services
-    FlextMeltanoTargetService,
-    # Types and protocols
-    FlextSingerTypes,
-    FlextTargetAbstractions,
-    FlextTargetPlugin,
-    # Stream and configuration
-    StreamDefinition,
-    # Service protocols
-    TargetServiceProtocol,
-)
+    # === FLEXT-MELTANO INTEGRATION ===
+    # Visible to type checkers only; resolved at runtime by ``__getattr__``
+    from flext_meltano import (
+        # Bridge integration
+        FlextMeltanoBridge,
+        # Configuration and validation
+        FlextMeltanoConfig,
+        # Enterprise services
+        FlextMeltanoTargetService,
+        # Types and protocols
+        FlextSingerTypes,
+        FlextTargetAbstractions,
+        FlextTargetPlugin,
+        # Stream and configuration
+        StreamDefinition,
+        # Service protocols
+        TargetServiceProtocol,
+    )
 
-# === PEP8 CONSOLIDATED MODULE IMPORTS ===
-# Import from consolidated PEP8 modules for better organization
-from flext_target_ldif.target_client import (
-    LDIFSink,
-    LdifWriter,
-    TargetClient,
-    TargetLDIF,
-    TargetSink,
-    TargetWriter,
-)
-from flext_target_ldif.target_config import FlextTargetLdifConfig, TargetConfig
-from flext_target_ldif.target_exceptions import (
-    FlextTargetLdifError,
-    FlextTargetLdifErrorDetails,
-    FlextTargetLdifFileError,
-    FlextTargetLdifInfrastructureError,
-    FlextTargetLdifSchemaError,
-    FlextTargetLdifTransformationError,
-    FlextTargetLdifWriterError,
-    TargetError,
-    TargetErrorDetails,
-    TargetFileError,
-    TargetInfrastructureError,
-    TargetSchemaError,
-    TargetTransformationError,
-    TargetWriterError,
-)
-from flext_target_ldif.models import (
-    RecordTransformer,
-    TargetTransformer,
-    TargetValidator,
-    ValidationError,
-    normalize_attribute_value,
-    sanitize_attribute_name,
-    transform_boolean,
-    transform_email,
-    transform_name,
-    transform_phone,
-    transform_timestamp,
-    validate_attribute_name,
-    validate_attribute_value,
-    validate_dn_component,
-    validate_record,
-    validate_schema,
-)
-from flext_target_ldif.target_services import (
-    TargetCLI,
-    TargetContainer,
-    TargetService,
-    cli_main,
-    config_target_dependencies,
-    configure_flext_target_ldif_dependencies,
-    get_flext_target_ldif_container,
-    get_flext_target_ldif_service,
-)
+    # Package modules, also resolved lazily at runtime
+    from flext_target_ldif.__version__ import __version__, __version_info__
+    from flext_target_ldif.models import (
+        RecordTransformer,
+        TargetTransformer,
+        TargetValidator,
+        ValidationError,
+        normalize_attribute_value,
+        sanitize_attribute_name,
+        transform_boolean,
+        transform_email,
+        transform_name,
+        transform_phone,
+        transform_timestamp,
+        validate_attribute_name,
+        validate_attribute_value,
+        validate_dn_component,
+        validate_record,
+        validate_schema,
+    )
+    from flext_target_ldif.target_client import (
+        LDIFSink,
+        LdifWriter,
+        TargetClient,
+        TargetLDIF,
+        TargetSink,
+        TargetWriter,
+    )
+    from flext_target_ldif.target_config import (
+        FlextTargetLdifConfig,
+        TargetConfig,
+    )
+    from flext_target_ldif.target_exceptions import (
+        FlextTargetLdifError,
+        FlextTargetLdifErrorDetails,
+        FlextTargetLdifFileError,
+        FlextTargetLdifInfrastructureError,
+        FlextTargetLdifSchemaError,
+        FlextTargetLdifTransformationError,
+        FlextTargetLdifWriterError,
+        TargetError,
+        TargetErrorDetails,
+        TargetFileError,
+        TargetInfrastructureError,
+        TargetSchemaError,
+        TargetTransformationError,
+        TargetWriterError,
+    )
+    from flext_target_ldif.target_services import (
+        TargetCLI,
+        TargetContainer,
+        TargetService,
+        cli_main,
+        config_target_dependencies,
+        configure_flext_target_ldif_dependencies,
+        get_flext_target_ldif_container,
+        get_flext_target_ldif_service,
+    )
+
+    # Backward compatibility aliases
+    FlextLDIFTarget = TargetLDIF
+    FlextTargetLDIF = TargetLDIF
+    LDIFTarget = TargetLDIF
+    FlextLDIFTargetConfig = FlextTargetLdifConfig
+    FlextTargetLDIFConfig = FlextTargetLdifConfig
+    TargetLDIFConfig = FlextTargetLdifConfig
+
+# === LAZY PUBLIC API (PEP 562) ===
+# Public names resolve to ``(module, attribute)`` on first access so that
+# importing the package does not pull in flext-meltano, the Singer SDK or
+# every internal submodule up front.
+_LAZY_IMPORTS: Final[dict[str, tuple[str, str]]] = {
+    # flext-meltano re-exports
+    "FlextMeltanoBridge": ("flext_meltano", "FlextMeltanoBridge"),
+    "FlextMeltanoConfig": ("flext_meltano", "FlextMeltanoConfig"),
+    "FlextMeltanoTargetService": ("flext_meltano", "FlextMeltanoTargetService"),
+    "FlextSingerTypes": ("flext_meltano", "FlextSingerTypes"),
+    "FlextTargetAbstractions": ("flext_meltano", "FlextTargetAbstractions"),
+    "FlextTargetPlugin": ("flext_meltano", "FlextTargetPlugin"),
+    "StreamDefinition": ("flext_meltano", "StreamDefinition"),
+    "TargetServiceProtocol": ("flext_meltano", "TargetServiceProtocol"),
+    # flext-core re-exports
+    "FlextExceptions": ("flext_core", "FlextExceptions"),
+    "FlextResult": ("flext_core", "FlextResult"),
+    "FlextModels": ("flext_core", "FlextModels"),
+    "FlextLogger": ("flext_core", "FlextLogger"),
+    # Configuration
+    "FlextTargetLdifConfig": (
+        "flext_target_ldif.target_config",
+        "FlextTargetLdifConfig",
+    ),
+    "TargetConfig": ("flext_target_ldif.target_config", "TargetConfig"),
+    # Client (Target + Sink + Writer)
+    "LDIFSink": ("flext_target_ldif.target_client", "LDIFSink"),
+    "LdifWriter": ("flext_target_ldif.target_client", "LdifWriter"),
+    "TargetClient": ("flext_target_ldif.target_client", "TargetClient"),
+    "TargetLDIF": ("flext_target_ldif.target_client", "TargetLDIF"),
+    "TargetSink": ("flext_target_ldif.target_client", "TargetSink"),
+    "TargetWriter": ("flext_target_ldif.target_client", "TargetWriter"),
+    # Models (Validation + Transformation)
+    "RecordTransformer": ("flext_target_ldif.models", "RecordTransformer"),
+    "TargetTransformer": ("flext_target_ldif.models", "TargetTransformer"),
+    "TargetValidator": ("flext_target_ldif.models", "TargetValidator"),
+    "ValidationError": ("flext_target_ldif.models", "ValidationError"),
+    "normalize_attribute_value": (
+        "flext_target_ldif.models",
+        "normalize_attribute_value",
+    ),
+    "sanitize_attribute_name": ("flext_target_ldif.models", "sanitize_attribute_name"),
+    "transform_boolean": ("flext_target_ldif.models", "transform_boolean"),
+    "transform_email": ("flext_target_ldif.models", "transform_email"),
+    "transform_name": ("flext_target_ldif.models", "transform_name"),
+    "transform_phone": ("flext_target_ldif.models", "transform_phone"),
+    "transform_timestamp": ("flext_target_ldif.models", "transform_timestamp"),
+    "validate_attribute_name": ("flext_target_ldif.models", "validate_attribute_name"),
+    "validate_attribute_value": (
+        "flext_target_ldif.models",
+        "validate_attribute_value",
+    ),
+    "validate_dn_component": ("flext_target_ldif.models", "validate_dn_component"),
+    "validate_record": ("flext_target_ldif.models", "validate_record"),
+    "validate_schema": ("flext_target_ldif.models", "validate_schema"),
+    # Exceptions
+    "FlextTargetLdifError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifError",
+    ),
+    "FlextTargetLdifErrorDetails": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifErrorDetails",
+    ),
+    "FlextTargetLdifFileError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifFileError",
+    ),
+    "FlextTargetLdifInfrastructureError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifInfrastructureError",
+    ),
+    "FlextTargetLdifSchemaError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifSchemaError",
+    ),
+    "FlextTargetLdifTransformationError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifTransformationError",
+    ),
+    "FlextTargetLdifWriterError": (
+        "flext_target_ldif.target_exceptions",
+        "FlextTargetLdifWriterError",
+    ),
+    "TargetError": ("flext_target_ldif.target_exceptions", "TargetError"),
+    "TargetErrorDetails": ("flext_target_ldif.target_exceptions", "TargetErrorDetails"),
+    "TargetFileError": ("flext_target_ldif.target_exceptions", "TargetFileError"),
+    "TargetInfrastructureError": (
+        "flext_target_ldif.target_exceptions",
+        "TargetInfrastructureError",
+    ),
+    "TargetSchemaError": ("flext_target_ldif.target_exceptions", "TargetSchemaError"),
+    "TargetTransformationError": (
+        "flext_target_ldif.target_exceptions",
+        "TargetTransformationError",
+    ),
+    "TargetWriterError": ("flext_target_ldif.target_exceptions", "TargetWriterError"),
+    # Services (DI + CLI)
+    "TargetCLI": ("flext_target_ldif.target_services", "TargetCLI"),
+    "TargetContainer": ("flext_target_ldif.target_services", "TargetContainer"),
+    "TargetService": ("flext_target_ldif.target_services", "TargetService"),
+    "cli_main": ("flext_target_ldif.target_services", "cli_main"),
+    "config_target_dependencies": (
+        "flext_target_ldif.target_services",
+        "config_target_dependencies",
+    ),
+    "configure_flext_target_ldif_dependencies": (
+        "flext_target_ldif.target_services",
+        "configure_flext_target_ldif_dependencies",
+    ),
+    "get_flext_target_ldif_container": (
+        "flext_target_ldif.target_services",
+        "get_flext_target_ldif_container",
+    ),
+    "get_flext_target_ldif_service": (
+        "flext_target_ldif.target_services",
+        "get_flext_target_ldif_service",
+    ),
+    # === BACKWARD COMPATIBILITY ALIASES ===
+    # Ensure all existing code continues to work
+    "FlextLDIFTarget": ("flext_target_ldif.target_client", "TargetLDIF"),
+    "FlextLDIFTargetConfig": (
+        "flext_target_ldif.target_config",
+        "FlextTargetLdifConfig",
+    ),
+    "FlextTargetLDIF": ("flext_target_ldif.target_client", "TargetLDIF"),
+    "FlextTargetLDIFConfig": (
+        "flext_target_ldif.target_config",
+        "FlextTargetLdifConfig",
+    ),
+    "LDIFTarget": ("flext_target_ldif.target_client", "TargetLDIF"),
+    "TargetLDIFConfig": ("flext_target_ldif.target_config", "FlextTargetLdifConfig"),
+}
 
-# === BACKWARD COMPATIBILITY IMPORTS ===
-# Direct imports for existing code compatibility
-from flext_target_ldif.config import FlextTargetLdifConfig as _FlextTargetLdifConfig
-from flext_target_ldif.sinks import LDIFSink as _LDIFSink
-from flext_target_ldif.target import TargetLDIF as _TargetLDIF
-from flext_target_ldif.writer import LdifWriter as _LdifWriter
 
-# === BACKWARD COMPATIBILITY ALIASES ===
-# Ensure all existing code continues to work
-FlextLDIFTarget = _TargetLDIF
-FlextLDIFTargetConfig = _FlextTargetLdifConfig
-FlextTargetLDIF = _TargetLDIF
-FlextTargetLDIFConfig = _FlextTargetLdifConfig
-LDIFTarget = _TargetLDIF
-TargetLDIFConfig = _FlextTargetLdifConfig
+def __getattr__(name: str) -> object:
+    """Resolve public names lazily on first access (PEP 562)."""
+    if name in {"__version__", "__version_info__"}:
+        # Importing the submodule binds it as ``__version__``; rebind both
+        version_module = importlib.import_module("flext_target_ldif.__version__")
+        globals()["__version__"] = version_module.__version__
+        globals()["__version_info__"] = version_module.__version_info__
+        return globals()[name]
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
 
-# FlextTargetLdifConfig already imported from target_config module above
 
-# Version following semantic versioning
-try:
-    __version__ = importlib.metadata.version("flext-target-ldif")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.9.0-enterprise"
+def __dir__() -> list[str]:
+    """List eagerly bound and lazily resolvable public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS, "__version__", "__version_info__"})
 
-__version_info__ = tuple(int(x) for x in __version__.split(".") if x.isdigit())
 
 # Complete public API exports with PEP8 consolidation and backward compatibility
-__all__: list[str] = [
+__all__: Final[tuple[str, ...]] = (
     # === FLEXT-MELTANO RE-EXPORTS ===
     "FlextMeltanoBridge",
     "FlextMeltanoConfig",
@@ -186,4 +331,4 @@ __all__: list[str] = [
     # === METADATA ===
     "__version__",
     "__version_info__",
-]
+)
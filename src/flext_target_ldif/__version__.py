@@ -7,10 +7,14 @@ from __future__ import annotations
 
 import importlib.metadata
 
-# Simple version implementation for architectural compliance
-try:
-    __version__ = importlib.metadata.version("flext-target-ldif")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.9.0"
 
-__version_info__ = tuple(int(x) for x in __version__.split(".") if x.isdigit())
+def _get_version() -> str:
+    """Look up the installed distribution version."""
+    try:
+        return importlib.metadata.distribution("flext-target-ldif").version
+    except importlib.metadata.PackageNotFoundError:
+        return "0.9.0"
+
+
+__version__ = _get_version()
+__version_info__ = tuple(int(part) for part in __version__.split(".") if part.isdigit())
@@ -0,0 +1,56 @@
+"""DN template parsing and rendering shared by configuration and writer.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import functools
+import string
+from collections.abc import Mapping
+from typing import Final
+
+# One parsed template piece: (literal, field_name, format_spec, conversion)
+DnSegment = tuple[str, str | None, str | None, str | None]
+
+# str.format conversion flags ("!r", "!s", "!a") applied to DN template fields
+_CONVERSIONS: Final = {"r": repr, "s": str, "a": ascii}
+
+
+@functools.lru_cache(maxsize=32)
+def parse_dn_template(template: str) -> tuple[DnSegment, ...]:
+    """Split a DN template into segments, once per template.
+
+    Raises ``ValueError`` for malformed braces or unknown conversions.
+    """
+    segments = tuple(string.Formatter().parse(template))
+    for _, _, _, conversion in segments:
+        if conversion and conversion not in _CONVERSIONS:
+            msg = f"Unknown conversion specifier {conversion!r}"
+            raise ValueError(msg)
+    return segments
+
+
+def render_dn(segments: tuple[DnSegment, ...], values: Mapping[str, object]) -> str:
+    """Fill parsed DN segments from ``values`` like ``str.format`` would.
+
+    Raises ``KeyError`` with the field name if a template field is missing.
+    """
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in segments:
+        parts.append(literal)
+        if field_name is None:
+            continue
+        value = values[field_name]
+        if conversion:
+            value = _CONVERSIONS[conversion](value)
+        parts.append(format(value, format_spec) if format_spec else str(value))
+    return "".join(parts)
+
+
+__all__: list[str] = [
+    "DnSegment",
+    "parse_dn_template",
+    "render_dn",
+]
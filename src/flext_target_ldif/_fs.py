@@ -0,0 +1,23 @@
+"""Filesystem helpers shared by configuration, target and writer.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def ensure_output_dir(output_path: str | os.PathLike[str]) -> None:
+    """Create ``output_path`` (and parents) if it does not exist.
+
+    Not cached: a directory removed between runs must be recreated, and
+    callers invoke this once per file or sink, not per record.
+    """
+    os.makedirs(output_path, exist_ok=True)
+
+
+__all__: list[str] = [
+    "ensure_output_dir",
+]
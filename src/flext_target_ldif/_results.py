@@ -0,0 +1,19 @@
+"""Shared FlextResult constants for flext-target-ldif.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from flext_core import FlextResult
+
+# Shared success result; ok(None) results carry no per-call state
+OK: Final[FlextResult[None]] = FlextResult[None].ok(None)
+
+
+__all__: list[str] = [
+    "OK",
+]
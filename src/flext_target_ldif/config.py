@@ -6,13 +6,68 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from pathlib import Path
+import functools
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final, Self, cast
 
 from flext_core import FlextModels, FlextResult
 
 # Basic validation without dependencies
 from pydantic import Field, field_validator
 
+from flext_target_ldif._dn import parse_dn_template, render_dn
+from flext_target_ldif._fs import ensure_output_dir
+from flext_target_ldif._results import OK
+from flext_target_ldif.typings import LdifOptions
+
+# Default LDIF format options, built once; each config gets its own copy
+_DEFAULT_LDIF_OPTIONS: Final[Mapping[str, object]] = MappingProxyType(
+    {
+        "line_length": 78,
+        "base64_encode": False,
+        "include_timestamps": True,
+    },
+)
+
+
+# Sample field values used to render a DN template during validation
+_SAMPLE_DN_VALUES: Final[Mapping[str, object]] = MappingProxyType(
+    {"uid": "testuser", "cn": "Test User"},
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_dn_template_rules(dn_template: str) -> FlextResult[None]:
+    """Check DN template business rules; the outcome is cached per template."""
+    # Use flext-ldap for DN validation - NO local duplication
+    if not dn_template:
+        return FlextResult[None].fail("DN template cannot be empty")
+
+    # Parse with the writer's parser so both accept the same templates
+    segments = parse_dn_template(dn_template)
+
+    # For template validation, create a sample DN with dummy values; format
+    # specs depend on the real value types, so the sample rendering drops them
+    sample_segments = tuple(
+        (literal, field_name, None, conversion)
+        for literal, field_name, _, conversion in segments
+    )
+    sample_values = {
+        field_name: _SAMPLE_DN_VALUES.get(field_name, "")
+        for _, field_name, _, _ in segments
+        if field_name is not None
+    }
+    sample_dn = render_dn(sample_segments, sample_values)
+    # Basic DN validation - check if contains = and ,
+    if "=" not in sample_dn or not sample_dn.strip():
+        return FlextResult[None].fail(
+            "DN template format is invalid - must follow LDAP DN structure",
+        )
+
+    return OK
+
 
 class FlextTargetLdifConfig(FlextModels.Config):
     """Configuration for FLEXT Target LDIF using FlextConfig.BaseModel patterns."""
@@ -33,14 +88,8 @@ class FlextTargetLdifConfig(FlextModels.Config):
         default_factory=dict,
         description="Mapping of stream fields to LDAP attributes",
     )
-    ldif_options: dict[str, object] = Field(
-        default_factory=lambda: dict[str, object](
-            {
-                "line_length": 78,
-                "base64_encode": False,
-                "include_timestamps": True,
-            },
-        ),
+    ldif_options: LdifOptions = Field(
+        default_factory=lambda: cast("LdifOptions", dict(_DEFAULT_LDIF_OPTIONS)),
         description="LDIF format options",
     )
 
@@ -52,9 +101,9 @@ class FlextTargetLdifConfig(FlextModels.Config):
             msg = "Output path cannot be empty"
             raise ValueError(msg)
 
-        path = Path(v)
         try:
-            path.mkdir(parents=True, exist_ok=True)
+            if not os.path.isdir(v):
+                ensure_output_dir(v)
         except (OSError, PermissionError) as e:
             error_msg: str = f"Cannot create output directory: {e}"
             raise ValueError(error_msg) from e
@@ -75,34 +124,30 @@ class FlextTargetLdifConfig(FlextModels.Config):
 
         return v
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, object]) -> Self:
+        """Build a config from data that has already been validated once.
+
+        Skips field validators (and the ``output_path`` mkdir) via
+        ``model_construct``; use the regular constructor for external input.
+        """
+        return cls.model_construct(**data)
+
     def validate_business_rules(self) -> FlextResult[None]:
         """Validate LDIF target configuration business rules using FlextModels.Config pattern."""
+        # Validate output path is accessible; a single stat when it exists,
+        # recreated if it was removed since the config was validated
+        try:
+            if not os.path.isdir(self.output_path):
+                ensure_output_dir(self.output_path)
+        except OSError as e:
+            return FlextResult[None].fail(f"Cannot access output path: {e}")
+
+        # DN rules depend only on the template string, so they are cached
         try:
-            # Validate output path is accessible
-            output_path = Path(self.output_path)
-            if not output_path.exists():
-                try:
-                    output_path.mkdir(parents=True, exist_ok=True)
-                except (OSError, PermissionError) as e:
-                    return FlextResult[None].fail(f"Cannot access output path: {e}")
-
-            # Use flext-ldap for DN validation - NO local duplication
-            if not self.dn_template:
-                return FlextResult[None].fail("DN template cannot be empty")
-
-            # For template validation, create a sample DN with dummy values
-            sample_dn = self.dn_template.replace("{uid}", "testuser").replace(
-                "{cn}",
-                "Test User",
-            )
-            # Basic DN validation - check if contains = and ,
-            if "=" not in sample_dn or not sample_dn.strip():
-                return FlextResult[None].fail(
-                    "DN template format is invalid - must follow LDAP DN structure",
-                )
-
-            return FlextResult[None].ok(None)
-        except Exception as e:
+            return _validate_dn_template_rules(self.dn_template)
+        except ValueError as e:
+            # Unbalanced braces or unknown conversions in the template
             return FlextResult[None].fail(f"Configuration validation failed: {e}")
 
 
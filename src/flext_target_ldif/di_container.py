@@ -12,6 +12,8 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import threading
+
 # 🚨 ARCHITECTURAL COMPLIANCE: Use ONLY official flext-core FlextContainer
 from flext_core import FlextContainer
 
@@ -23,12 +25,21 @@ class _ContainerManager:
 
     def __init__(self) -> None:
         self.container: FlextContainer | None = None
+        self._lock = threading.Lock()
 
     def get_container(self) -> FlextContainer:
-        """Get or create container instance."""
-        if self.container is None:
-            self.container = FlextContainer()
-        return self.container
+        """Get or create container instance.
+
+        The lock is only taken while the container is first created; later
+        calls return the existing instance without locking.
+        """
+        container = self.container
+        if container is not None:
+            return container
+        with self._lock:
+            if self.container is None:
+                self.container = FlextContainer()
+            return self.container
 
 
 # Module-level container manager
@@ -60,15 +71,6 @@ def get_flext_target_ldif_service(service_name: str) -> object:
       Service instance or None if not found.
 
     """
-    container = get_flext_target_ldif_container()
-    result = container.get(service_name)
-
-    if result.success:
-        return result.data
-
+    result = _container_manager.get_container().get(service_name)
     # Service not found - silent fail for now
-    return None
-
-
-# Initialize flext_target_ldif dependencies on module import
-configure_flext_target_ldif_dependencies()
+    return result.data if result.success else None
@@ -8,12 +8,22 @@ Domain-specific exceptions using factory pattern to eliminate 200+ lines of dupl
 
 from __future__ import annotations
 
+from typing import Final
+
 from flext_core import (
     FlextExceptions,
     FlextModels,
     FlextResult,
 )
 
+from flext_target_ldif._results import OK
+
+# Domain rule constants for FlextTargetLdifErrorDetails
+_ERROR_CODE_PREFIX: Final = "LDIF"
+_VALID_SOURCE_COMPONENTS: Final = frozenset(
+    {"writer", "sinks", "target", "infrastructure", "validation"},
+)
+
 
 # Base exception class for flext-target-ldif
 class FlextTargetLdifError(FlextExceptions._Error):
@@ -41,17 +51,17 @@ class FlextTargetLdifTransformationError(FlextExceptions._ProcessingError):
         **kwargs: object,
     ) -> None:
         """Initialize LDIF target transformation error with context."""
-        context = kwargs.copy()
+        # ``**kwargs`` is already a fresh dict per call; extend it in place
         if record_data is not None:
             # Include minimal record info for debugging
-            context["record_keys"] = list(record_data.keys())
+            kwargs["record_keys"] = list(record_data.keys())
         if transformation_stage is not None:
-            context["transformation_stage"] = transformation_stage
+            kwargs["transformation_stage"] = transformation_stage
 
         super().__init__(
             f"LDIF target transformation: {message}",
             business_rule="ldif_transformation",
-            context=context,
+            context=kwargs,
         )
 
 
@@ -65,11 +75,10 @@ class FlextTargetLdifInfrastructureError(FlextTargetLdifError):
         **kwargs: object,
     ) -> None:
         """Initialize LDIF target infrastructure error with context."""
-        context = kwargs.copy()
         if component is not None:
-            context["component"] = component
+            kwargs["component"] = component
 
-        super().__init__(f"LDIF target infrastructure: {message}", **context)
+        super().__init__(f"LDIF target infrastructure: {message}", **kwargs)
 
 
 class FlextTargetLdifWriterError(FlextTargetLdifError):
@@ -83,13 +92,12 @@ class FlextTargetLdifWriterError(FlextTargetLdifError):
         **kwargs: object,
     ) -> None:
         """Initialize LDIF writer error with context."""
-        context = kwargs.copy()
         if output_file is not None:
-            context["output_file"] = output_file
+            kwargs["output_file"] = output_file
         if line_number is not None:
-            context["line_number"] = line_number
+            kwargs["line_number"] = line_number
 
-        super().__init__(f"LDIF writer: {message}", **context)
+        super().__init__(f"LDIF writer: {message}", **kwargs)
 
 
 class FlextTargetLdifFileError(FlextTargetLdifError):
@@ -103,13 +111,12 @@ class FlextTargetLdifFileError(FlextTargetLdifError):
         **kwargs: object,
     ) -> None:
         """Initialize LDIF target file error with context."""
-        context = kwargs.copy()
         if file_path is not None:
-            context["file_path"] = file_path
+            kwargs["file_path"] = file_path
         if operation is not None:
-            context["operation"] = operation
+            kwargs["operation"] = operation
 
-        super().__init__(f"LDIF target file: {message}", **context)
+        super().__init__(f"LDIF target file: {message}", **kwargs)
 
 
 class FlextTargetLdifSchemaError(FlextExceptions._ValidationError):
@@ -141,28 +148,18 @@ class FlextTargetLdifErrorDetails(FlextModels):
 
     def validate_domain_rules(self) -> FlextResult[None]:
         """Validate domain-specific business rules."""
-        try:
-            # Validate error code format
-            if not self.error_code or not self.error_code.startswith("LDIF"):
-                return FlextResult[None].fail("Error code must start with 'LDIF'")
-
-            # Validate error type is not empty
-            if not self.error_type:
-                return FlextResult[None].fail("Error type cannot be empty")
-
-            # Validate source component is valid
-            valid_components = [
-                "writer",
-                "sinks",
-                "target",
-                "infrastructure",
-                "validation",
-            ]
-            if self.source_component not in valid_components:
-                return FlextResult[None].fail(
-                    f"Invalid source component: {self.source_component}",
-                )
-
-            return FlextResult[None].ok(None)
-        except Exception as e:
-            return FlextResult[None].fail(f"Domain validation failed: {e}")
+        # Validate error code format
+        if not self.error_code.startswith(_ERROR_CODE_PREFIX):
+            return FlextResult[None].fail("Error code must start with 'LDIF'")
+
+        # Validate error type is not empty
+        if not self.error_type:
+            return FlextResult[None].fail("Error type cannot be empty")
+
+        # Validate source component is valid
+        if self.source_component not in _VALID_SOURCE_COMPONENTS:
+            return FlextResult[None].fail(
+                f"Invalid source component: {self.source_component}",
+            )
+
+        return OK
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import Final
 
 # Use available flext-meltano abstractions
 from flext_target_ldif.writer import LdifWriter
 
+# Word characters (Unicode letters, digits, underscore) and hyphen are kept
+_UNSAFE_STREAM_CHARS_RE: Final = re.compile(r"[^\w-]")
+
 
 class LDIFSink:
     """Singer sink for writing records to LDIF format."""
@@ -24,82 +29,83 @@ class LDIFSink:
         self.schema = schema
         self.key_properties = key_properties or []
 
+        # Resolve the sink's config once; the writer is built from these fields
+        output_path_str = target_config.get("output_path", "./output")
+        if not isinstance(output_path_str, str):
+            output_path_str = "./output"
+        # Create safe filename from stream name
+        safe_name = _UNSAFE_STREAM_CHARS_RE.sub("", stream_name) or "stream"
+        self._output_file: Path = Path(output_path_str) / f"{safe_name}.ldif"
+
+        # Type-safe config extraction
+        ldif_options = target_config.get("ldif_options", {})
+        self._ldif_options = ldif_options if isinstance(ldif_options, dict) else {}
+
+        dn_template = target_config.get("dn_template")
+        self._dn_template = dn_template if isinstance(dn_template, str) else None
+
+        attribute_mapping = target_config.get("attribute_mapping", {})
+        self._attribute_mapping = (
+            attribute_mapping if isinstance(attribute_mapping, dict) else {}
+        )
+
         self._ldif_writer: LdifWriter | None = None
-        self._output_file: Path | None = None
+        # Records received since the last batch, handed to the writer at once
+        self._pending: list[dict[str, object]] = []
 
     def _get_output_file(self) -> Path:
         """Get the output file path for this stream."""
-        if self._output_file is None:
-            output_path_str = self.config.get("output_path", "./output")
-            if not isinstance(output_path_str, str):
-                output_path_str = "./output"
-            output_path = Path(output_path_str)
-
-            # Create safe filename from stream name
-            safe_name = "".join(
-                c for c in self.stream_name if c.isalnum() or c in "-_"
-            ).strip()
-            if not safe_name:
-                safe_name = "stream"
-
-            filename = f"{safe_name}.ldif"
-            self._output_file = output_path / filename
-
         return self._output_file
 
     def _get_ldif_writer(self) -> LdifWriter:
         """Get or create the LDIF writer for this sink."""
         if self._ldif_writer is None:
-            output_file = self._get_output_file()
-
-            # Type-safe config extraction
-            ldif_options = self.config.get("ldif_options", {})
-            if not isinstance(ldif_options, dict):
-                ldif_options = {}
-
-            dn_template = self.config.get("dn_template")
-            if dn_template is not None and not isinstance(dn_template, str):
-                dn_template = None
-
-            attribute_mapping = self.config.get("attribute_mapping", {})
-            if not isinstance(attribute_mapping, dict):
-                attribute_mapping = {}
-
             self._ldif_writer = LdifWriter(
-                output_file=output_file,
-                ldif_options=ldif_options,
-                dn_template=dn_template,
-                attribute_mapping=attribute_mapping,
+                output_file=self._output_file,
+                ldif_options=self._ldif_options,
+                dn_template=self._dn_template,
+                attribute_mapping=self._attribute_mapping,
                 schema=self.schema,
             )
-
         return self._ldif_writer
 
     def process_batch(self, _context: dict[str, object]) -> None:
         """Process a batch of records."""
-        # BatchSink handles the batching, we just need to ensure writer is ready
         self._get_ldif_writer()
+        self._flush_pending()
 
     def process_record(
         self,
         record: dict[str, object],
         _context: dict[str, object],
     ) -> None:
-        """Process a single record and write to LDIF."""
-        ldif_writer = self._get_ldif_writer()
-        result = ldif_writer.write_record(record)
+        """Queue a single record for the next batch write."""
+        self._pending.append(record)
+
+    def _flush_pending(self) -> None:
+        """Hand all queued records to the LDIF writer in one call."""
+        if not self._pending:
+            return
+        result = self._get_ldif_writer().write_records(self._pending)
+        self._pending.clear()
         if not result.success:
-            msg: str = f"Failed to write LDIF record: {result.error}"
+            msg: str = f"Failed to write LDIF records: {result.error}"
             raise RuntimeError(msg)
 
     def clean_up(self) -> None:
-        """Clean up resources when sink is finished."""
-        if self._ldif_writer:
-            result = self._ldif_writer.close()
-            if not result.success and hasattr(self, "logger"):
-                self.logger.error("Failed to close LDIF writer: %s", result.error)
-            elif hasattr(self, "logger"):
-                self.logger.info("LDIF file written: %s", self._output_file)
+        """Clean up resources when sink is finished.
+
+        The writer is closed even if flushing the queued records fails.
+        """
+        try:
+            self._flush_pending()
+        finally:
+            if self._ldif_writer:
+                result = self._ldif_writer.close()
+                if not result.success and hasattr(self, "logger"):
+                    self.logger.error("Failed to close LDIF writer: %s", result.error)
+                elif hasattr(self, "logger"):
+                    self.logger.info("LDIF file written: %s", self._output_file)
 
     @property
     def ldif_writer(self) -> LdifWriter:
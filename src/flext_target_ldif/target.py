@@ -3,8 +3,7 @@
 # MIGRATED: Singer SDK imports centralized via flext-meltano
 from __future__ import annotations
 
-from pathlib import Path
-
+from flext_target_ldif._fs import ensure_output_dir
 from flext_target_ldif.sinks import LDIFSink
 
 
@@ -21,16 +20,19 @@ class TargetLDIF:
         self.config = config or {}
         self.sinks: dict[str, LDIFSink] = {}
 
-        # Ensure output directory exists
         output_path_str = self.config.get("output_path", "./output")
         if not isinstance(output_path_str, str):
             output_path_str = "./output"
-        output_path = Path(output_path_str)
-        output_path.mkdir(parents=True, exist_ok=True)
+        self._output_path = output_path_str
+        self._output_dir_ready = False
 
     def get_sink(self, stream_name: str, schema: dict[str, object]) -> LDIFSink:
         """Get or create a sink for the given stream."""
         if stream_name not in self.sinks:
+            # Ensure output directory exists before the first sink writes
+            if not self._output_dir_ready:
+                ensure_output_dir(self._output_path)
+                self._output_dir_ready = True
             self.sinks[stream_name] = LDIFSink(
                 target_config=self.config,
                 stream_name=stream_name,
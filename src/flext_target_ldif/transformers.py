@@ -5,11 +5,27 @@ Eliminates code duplication by using LDAP transformation functionality from flex
 
 from __future__ import annotations
 
+import functools
+import re
+import types
 import typing as t
 from datetime import datetime
 
 # Use flext-ldap for LDAP-specific transformations instead of duplicating
 
+# Formatting characters kept in phone numbers besides the digits
+_PHONE_FORMAT_CHARS: t.Final = "+- ()"
+
+# Anything other than ASCII digits and the phone formatting characters
+_PHONE_STRIP_RE: t.Final = re.compile(r"[^\d+\- ()]", re.ASCII)
+
+# Length of a trailing ISO 8601 UTC offset such as "+02:00"
+_TZ_OFFSET_LEN: t.Final = 6
+
+# Lowercased spellings accepted by transform_boolean
+_TRUE_VALUES: t.Final = frozenset({"true", "yes", "1", "on"})
+_FALSE_VALUES: t.Final = frozenset({"false", "no", "0", "off"})
+
 
 def transform_timestamp(value: object) -> str:
     """Transform timestamp values to LDAP timestamp format using flext-ldap."""
@@ -21,18 +37,30 @@ def transform_timestamp(value: object) -> str:
         return value.isoformat()
 
     if isinstance(value, str):
-        try:
-            # Try to parse ISO format first, then use flext-ldap parsing
-            dt = datetime.fromisoformat(value.removesuffix("Z") + "+00:00")
-            return dt.isoformat()
-        except ValueError:
-            # Return as-is if not parseable
-            return value
+        # Values that already carry a "+HH:MM"/"-HH:MM" offset cannot take
+        # the appended UTC offset and were always returned unchanged
+        if len(value) > _TZ_OFFSET_LEN:
+            offset = value[-_TZ_OFFSET_LEN:]
+            if offset[0] in "+-" and offset[3] == ":":
+                return value
+        return _normalize_iso_timestamp(value)
 
     # Fallback - convert to string for other types
     return str(value)
 
 
+@functools.lru_cache(maxsize=8192)
+def _normalize_iso_timestamp(value: str) -> str:
+    """Normalize an ISO 8601 string to UTC ``isoformat``; cached per value."""
+    try:
+        # Try to parse ISO format first, then use flext-ldap parsing
+        dt = datetime.fromisoformat(value.removesuffix("Z") + "+00:00")
+        return dt.isoformat()
+    except ValueError:
+        # Return as-is if not parseable
+        return value
+
+
 def transform_boolean(value: object) -> str:
     """Transform boolean values to LDAP boolean format."""
     if value is None:
@@ -43,9 +71,9 @@ def transform_boolean(value: object) -> str:
 
     if isinstance(value, str):
         lower_val = value.lower()
-        if lower_val in {"true", "yes", "1", "on"}:
+        if lower_val in _TRUE_VALUES:
             return "TRUE"
-        if lower_val in {"false", "no", "0", "off"}:
+        if lower_val in _FALSE_VALUES:
             return "FALSE"
 
     return str(value)
@@ -72,8 +100,12 @@ def transform_phone(value: object) -> str:
 
     phone_str = str(value)
 
-    # Remove common formatting characters
-    return "".join(c for c in phone_str if c.isdigit() or c in "+- ()")
+    # Keep digits and common formatting characters. For ASCII input "\d"
+    # matches exactly what str.isdigit() accepts; other text keeps the
+    # isdigit() check, which also accepts e.g. superscript digits
+    if phone_str.isascii():
+        return _PHONE_STRIP_RE.sub("", phone_str)
+    return "".join(c for c in phone_str if c.isdigit() or c in _PHONE_FORMAT_CHARS)
 
 
 def transform_name(value: object) -> str:
@@ -83,27 +115,44 @@ def transform_name(value: object) -> str:
 
     name_str = str(value).strip()
 
-    # Capitalize first letter of each word
-    return " ".join(word.capitalize() for word in name_str.split())
+    # Capitalize first letter of each word; map() keeps the loop in C
+    return " ".join(map(str.capitalize, name_str.split()))
+
 
+# Built-in transformers keyed by exact lowercased attribute name
+_BUILTIN_TRANSFORMERS: t.Final[dict[str, t.Callable[[object], str]]] = {
+    "mail": transform_email,
+    "email": transform_email,
+    "telephonenumber": transform_phone,
+    "phone": transform_phone,
+    "mobile": transform_phone,
+    "givenname": transform_name,
+    "sn": transform_name,
+    "cn": transform_name,
+    "displayname": transform_name,
+    "createtimestamp": transform_timestamp,
+    "modifytimestamp": transform_timestamp,
+}
 
+
+@functools.lru_cache(maxsize=1024)
 def _get_builtin_transformer(attr_name: str) -> t.Callable[[object], str] | None:
-    """Get built-in transformer function for attribute name."""
+    """Get built-in transformer function for attribute name; cached per name."""
     attr_lower = attr_name.lower()
 
-    if attr_lower in {"mail", "email"}:
-        return transform_email
-    if attr_lower in {"telephonenumber", "phone", "mobile"}:
-        return transform_phone
-    if attr_lower in {"givenname", "sn", "cn", "displayname"}:
-        return transform_name
-    if attr_lower in {"createtimestamp", "modifytimestamp"}:
-        return transform_timestamp
+    builtin_transformer = _BUILTIN_TRANSFORMERS.get(attr_lower)
+    if builtin_transformer is not None:
+        return builtin_transformer
     if attr_lower.endswith("boolean") or attr_lower.startswith("is"):
         return transform_boolean
     return None
 
 
+def _strip_value(value: object) -> str:
+    """Default transformation: convert to string and strip whitespace."""
+    return str(value).strip()
+
+
 def normalize_attribute_value(
     attr_name: str,
     value: object,
@@ -113,21 +162,20 @@ def normalize_attribute_value(
     if value is None:
         return ""
 
-    # Use custom transformers if provided
-    if transformers and attr_name in transformers:
-        return transformers[attr_name](value)
-
-    # Try built-in transformations
-    builtin_transformer = _get_builtin_transformer(attr_name)
-    if builtin_transformer:
-        return builtin_transformer(value)
-
-    # Default: convert to string and strip whitespace
-    return str(value).strip()
+    # Use custom transformers if provided, then built-in ones; the default
+    # converts to string and strips whitespace
+    transform = transformers.get(attr_name) if transformers else None
+    if transform is None:
+        transform = _get_builtin_transformer(attr_name) or _strip_value
+    return transform(value)
 
 
 class RecordTransformer:
-    """Transform Singer records for LDIF output."""
+    """Transform Singer records for LDIF output.
+
+    The attribute mapping and custom transformers are copied at construction
+    and exposed read-only, because field resolutions are cached per field.
+    """
 
     def __init__(
         self,
@@ -135,42 +183,89 @@ class RecordTransformer:
         custom_transformers: dict[str, t.Callable[[object], str]] | None = None,
     ) -> None:
         """Initialize the record transformer."""
-        self.attribute_mapping = attribute_mapping or {}
-        self.custom_transformers = custom_transformers or {}
+        self._attribute_mapping = dict(attribute_mapping or {})
+        self._custom_transformers = dict(custom_transformers or {})
+        # Per source field: (LDAP attribute name, value transformer)
+        self._field_dispatch: dict[str, tuple[str, t.Callable[[object], str]]] = {}
+
+    @property
+    def attribute_mapping(self) -> t.Mapping[str, str]:
+        """Read-only view of the field to attribute name mapping."""
+        return types.MappingProxyType(self._attribute_mapping)
+
+    @property
+    def custom_transformers(self) -> t.Mapping[str, t.Callable[[object], str]]:
+        """Read-only view of the custom transformers by attribute name."""
+        return types.MappingProxyType(self._custom_transformers)
+
+    def _resolve_field(self, field: str) -> tuple[str, t.Callable[[object], str]]:
+        """Resolve the LDAP attribute name and value transformer for a field."""
+        # Map field name if needed
+        if field in self._attribute_mapping:
+            attr_name = self._attribute_mapping[field]
+        else:
+            # Default mapping: convert to lowercase, remove underscores
+            attr_name = field.lower().replace("_", "")
+
+        # Custom transformers take precedence over built-in ones
+        if attr_name in self._custom_transformers:
+            return attr_name, self._custom_transformers[attr_name]
+        builtin_transformer = _get_builtin_transformer(attr_name)
+        if builtin_transformer:
+            return attr_name, builtin_transformer
+        return attr_name, _strip_value
+
+    def _fill_transformed(
+        self,
+        record: dict[str, object],
+        out: dict[str, str] | dict[str, object],
+    ) -> None:
+        """Store the transformed non-empty fields of ``record`` into ``out``.
 
-    def transform_record(self, record: dict[str, object]) -> dict[str, str]:
-        """Transform a Singer record to LDAP-compatible format."""
-        transformed = {}
+        Each source field is resolved to its attribute name and transformer
+        the first time it is seen; later records reuse that resolution.
+        """
+        dispatch = self._field_dispatch
 
         for field, value in record.items():
             # Skip None values
             if value is None:
                 continue
 
-            # Map field name if needed
-            if field in self.attribute_mapping:
-                attr_name = self.attribute_mapping[field]
-            else:
-                # Default mapping: convert to lowercase, remove underscores
-                attr_name = field.lower().replace("_", "")
-
-            # Transform value
-            transformed_value = normalize_attribute_value(
-                attr_name,
-                value,
-                self.custom_transformers,
-            )
+            entry = dispatch.get(field)
+            if entry is None:
+                entry = dispatch[field] = self._resolve_field(field)
+            attr_name, transform = entry
 
             # Only include non-empty values
+            transformed_value = transform(value)
             if transformed_value:
-                transformed[attr_name] = transformed_value
+                out[attr_name] = transformed_value
 
+    def transform_record(self, record: dict[str, object]) -> dict[str, str]:
+        """Transform a Singer record to LDAP-compatible format."""
+        transformed: dict[str, str] = {}
+        self._fill_transformed(record, transformed)
         return transformed
 
+    def build_ldap_record(self, record: dict[str, object]) -> dict[str, object]:
+        """Transform a Singer record and add required LDAP attributes.
+
+        Equivalent to ``add_required_attributes(transform_record(record))``
+        but builds the result in one pass instead of copying it.
+        """
+        result: dict[str, object] = {}
+        self._fill_transformed(record, result)
+        return self._complete_required_attributes(result)
+
     def add_required_attributes(self, record: dict[str, str]) -> dict[str, object]:
         """Add required LDAP attributes to the record."""
         result: dict[str, object] = dict(record)
+        return self._complete_required_attributes(result)
 
+    @staticmethod
+    def _complete_required_attributes(result: dict[str, object]) -> dict[str, object]:
+        """Add missing objectClass, cn and sn attributes to ``result`` in place."""
         # Ensure objectClass is present
         if "objectclass" not in result:
             result["objectclass"] = ["inetOrgPerson", "person"]
@@ -6,17 +6,35 @@
 
 from __future__ import annotations
 
+from typing import TypedDict
+
 from flext_core import E, F, FlextTypes as CoreFlextTypes, P, R, T, U, V
+from pydantic import ConfigDict, with_config
 
 
 class FlextTypes(CoreFlextTypes):
     """Target LDIF domain-specific types can extend here."""
 
 
+@with_config(ConfigDict(extra="allow"))
+class LdifOptions(TypedDict, total=False):
+    """LDIF format options accepted by the target configuration.
+
+    Only the options the writer reads are typed; any other keys supplied
+    by the user are kept as-is.
+    """
+
+    line_length: int
+    base64_encode: bool
+    include_timestamps: bool
+    buffer_size: int
+
+
 __all__ = [
     "E",
     "F",
     "FlextTypes",
+    "LdifOptions",
     "P",
     "R",
     "T",
@@ -5,10 +5,19 @@ Eliminates code duplication by using LDAP validation functionality from flext-ld
 
 from __future__ import annotations
 
+import functools
 import re
+from typing import Final
 
 # Use flext-ldif for LDIF-specific validation
 
+# Validation patterns, compiled once at import
+_DN_COMPONENT_RE: Final = re.compile(r"[a-zA-Z0-9\s\-\.@_]+")
+_INVALID_ATTRIBUTE_CHARS_RE: Final = re.compile(r"[^a-zA-Z0-9\-]")
+
+# Field names usable as the RDN when generating DNs
+_ID_FIELDS: Final = frozenset({"id", "uid", "user_id", "username"})
+
 
 class ValidationError(Exception):
     """Error raised when record validation fails."""
@@ -19,15 +28,21 @@ def validate_dn_component(value: str) -> bool:
     if not value:
         return False
     # Basic DN component validation
-    return bool(re.match(r"^[a-zA-Z0-9\s\-\.@_]+$", value))
+    return _DN_COMPONENT_RE.fullmatch(value) is not None
+
 
+# Field names repeat across records of a stream; results are cached per name
+_NAME_CACHE_SIZE: Final = 4096
 
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def validate_attribute_name(name: str) -> bool:
     """Validate LDAP attribute name."""
     if not name:
         return False
-    # Basic LDAP attribute name validation
-    return bool(re.match(r"^[a-zA-Z][a-zA-Z0-9\-]*$", name))
+    # Basic LDAP attribute name validation: an ASCII letter followed by
+    # ASCII letters, digits or hyphens, checked with C-level str predicates
+    return name.isascii() and name[0].isalpha() and name.replace("-", "").isalnum()
 
 
 # Constants for validation limits
@@ -43,13 +58,14 @@ def validate_attribute_value(value: object) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def sanitize_attribute_name(name: str) -> str:
     """Sanitize field name to be LDAP-compatible."""
     # Basic normalization
     normalized = name.lower().strip()
 
     # Remove invalid characters
-    sanitized = re.sub(r"[^a-zA-Z0-9\-]", "", normalized)
+    sanitized = _INVALID_ATTRIBUTE_CHARS_RE.sub("", normalized)
 
     # Ensure starts with letter
     if sanitized and not sanitized[0].isalpha():
@@ -71,11 +87,7 @@ def validate_record(record: dict[str, object]) -> dict[str, list[str]]:
         return errors
 
     # Check for required fields for DN generation
-    has_id_field = any(
-        field in record for field in ["id", "uid", "user_id", "username"]
-    )
-
-    if not has_id_field:
+    if record.keys().isdisjoint(_ID_FIELDS):
         errors["dn"] = [
             "Record must contain at least one ID field (id, uid, user_id, or username)",
         ]
@@ -117,11 +129,7 @@ def validate_schema(schema: dict[str, object]) -> dict[str, list[str]]:
         return errors
 
     # Check for ID-like fields
-    id_fields = [
-        field
-        for field in properties
-        if field.lower() in {"id", "uid", "user_id", "username"}
-    ]
+    id_fields = [field for field in properties if field.lower() in _ID_FIELDS]
 
     if not id_fields:
         errors["id_fields"] = [
@@ -9,17 +9,33 @@ implementation from flext-ldif project.
 
 from __future__ import annotations
 
+import binascii
+import re
+import time
 import types
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Self
+from typing import BinaryIO, Final, Self
 
 from flext_core import FlextLogger, FlextResult
 from flext_ldif import FlextLDIFAPI
 
+from flext_target_ldif._dn import parse_dn_template, render_dn
+from flext_target_ldif._fs import ensure_output_dir
 from flext_target_ldif.exceptions import FlextTargetLdifWriterError
 
 logger = FlextLogger(__name__)
 
+# RFC 2849 recommended maximum line length before folding
+DEFAULT_LINE_LENGTH: Final = 78
+
+# Values outside printable ASCII must be base64-encoded (RFC 2849 SAFE-STRING)
+_UNSAFE_VALUE_RE: Final = re.compile(rb"[^\x20-\x7e]")
+_UNSAFE_FIRST_BYTES: Final = frozenset(b" :<")
+
+# Default size of the binary write buffer used for the LDIF output file
+DEFAULT_BUFFER_SIZE: Final = 1024 * 1024
+
 
 class LdifWriter:
     """Writer for converting data records to LDIF format."""
@@ -36,100 +52,246 @@ class LdifWriter:
         self.output_file = Path(output_file) if output_file else Path("output.ldif")
         self.ldif_options = ldif_options or {}
         self.dn_template = dn_template or "uid={uid},ou=users,dc=example,dc=com"
+        # Parse the template once; shared with the config validation
+        try:
+            self._dn_segments = parse_dn_template(self.dn_template)
+        except ValueError as e:
+            msg = f"Invalid DN template {self.dn_template!r}: {e}"
+            raise FlextTargetLdifWriterError(msg) from e
         self.attribute_mapping = attribute_mapping or {}
         self.schema = schema or {}
+        line_length = self.ldif_options.get("line_length", DEFAULT_LINE_LENGTH)
+        # Folding needs room for the leading space plus at least one character
+        self.line_length = (
+            line_length
+            if isinstance(line_length, int) and line_length > 1
+            else DEFAULT_LINE_LENGTH
+        )
+        self.base64_encode = bool(self.ldif_options.get("base64_encode", False))
+        self.include_timestamps = bool(
+            self.ldif_options.get("include_timestamps", True),
+        )
+        buffer_size = self.ldif_options.get("buffer_size", DEFAULT_BUFFER_SIZE)
+        self.buffer_size = (
+            buffer_size
+            if isinstance(buffer_size, int) and buffer_size > 0
+            else DEFAULT_BUFFER_SIZE
+        )
         # Use flext-ldif API for writing
         self._ldif_api = FlextLDIFAPI()
-        self._records: list[dict[str, object]] = []
+        self._file_handle: BinaryIO | None = None
+        # Set once the header is written; later opens append to the file
+        self._header_written = False
+        self._buf = bytearray()
+        # Source field name -> encoded (mapped) LDIF attribute name
+        self._attr_names: dict[str, bytes] = {}
         self._record_count = 0
-        self._ldif_entries: list[dict[str, object]] = []
 
     def open(self) -> FlextResult[None]:
-        """Open the output file for writing."""
+        """Open the output file for writing and emit the LDIF header."""
         try:
+            self._open_handle()
+        except (OSError, RuntimeError, ValueError, TypeError) as e:
+            return FlextResult[None].fail(f"Failed to open LDIF file: {e}")
+        return FlextResult[None].ok(None)
+
+    def _open_handle(self) -> BinaryIO:
+        """Return the open output handle, opening the file on first use.
+
+        After ``close()`` the file is reopened in append mode so records
+        already written are kept and the header is not repeated.
+        """
+        handle = self._file_handle
+        if handle is None:
             # Create output directory if needed
-            self.output_file.parent.mkdir(parents=True, exist_ok=True)
-            return FlextResult[None].ok(None)
-        except (RuntimeError, ValueError, TypeError) as e:
-            return FlextResult[None].fail(f"Failed to prepare LDIF file: {e}")
+            ensure_output_dir(self.output_file.parent)
+            if self._header_written:
+                handle = self.output_file.open("ab", buffering=self.buffer_size)
+                self._file_handle = handle
+            else:
+                handle = self.output_file.open("wb", buffering=self.buffer_size)
+                self._file_handle = handle
+                handle.write(self._format_header().encode("utf-8"))
+                self._header_written = True
+        return handle
 
     def close(self) -> FlextResult[None]:
-        """Close the output file and write all collected records."""
-        try:
-            if self._records:
-                # Convert records to FlextLDIFEntry objects for flext-ldif API
-                self._ldif_entries = []
-                for record in self._records:
-                    try:
-                        dn = self._generate_dn(record)
-                        attributes = {}
-                        # Apply attribute mapping and add to entry
-                        for key, value in record.items():
-                            if key != "dn":  # Skip DN as it's already set
-                                mapped_key = self.attribute_mapping.get(key, key)
-                                attributes[mapped_key] = value
-                        # Create FlextLDIFEntry using the real API
-                        # Convert dict to list format expected by FlextLDIFAttributes
-                        attr_dict = {}
-                        for key, value in attributes.items():
-                            attr_dict[key] = (
-                                [str(value)]
-                                if not isinstance(value, list)
-                                else [str(v) for v in value]
-                            )
-                        # Create simple entry dict for LDIF writing
-                        entry: dict[str, object] = {
-                            "dn": dn,
-                            "attributes": dict(attr_dict),  # Ensure it's a dict
-                        }
-                        self._ldif_entries.append(entry)
-                    except (RuntimeError, ValueError, TypeError) as e:
-                        logger.warning("Skipping invalid record: %s", e)
-                        continue
-                # Write LDIF entries to file
-                with self.output_file.open("w", encoding="utf-8") as f:
-                    for entry in self._ldif_entries:
-                        dn_obj = entry.get("dn", "")
-                        dn_str = str(dn_obj) if dn_obj else ""
-                        attributes_obj = entry.get("attributes", {})
-                        f.write(f"dn: {dn_str}\n")
-                        if isinstance(attributes_obj, dict):
-                            for attr, values in attributes_obj.items():
-                                if isinstance(values, list):
-                                    for value in values:
-                                        f.write(f"{attr}: {value}\n")
-                                else:
-                                    f.write(f"{attr}: {values}\n")
-                        f.write("\n")  # Blank line between entries
-
-                write_result = FlextResult[str].ok("LDIF written successfully")
-                if not write_result.success:
-                    return FlextResult[None].fail(
-                        f"LDIF write failed: {write_result.error}"
-                    )
-                ldif_content = write_result.data or ""
-                # Write to file
-                self.output_file.write_text(ldif_content, encoding="utf-8")
+        """Flush buffered output and close the output file."""
+        handle = self._file_handle
+        if handle is None:
             return FlextResult[None].ok(None)
-        except (RuntimeError, ValueError, TypeError) as e:
+        self._file_handle = None
+        try:
+            handle.close()
+        except (OSError, ValueError) as e:
             return FlextResult[None].fail(f"Failed to close LDIF file: {e}")
+        return FlextResult[None].ok(None)
 
     def write_record(self, record: dict[str, object]) -> FlextResult[None]:
-        """Write a record to the LDIF file buffer."""
+        """Encode a record and write it to the LDIF file.
+
+        The file is opened on the first record if ``open()`` was not called.
+        """
         try:
-            # Buffer the record for batch writing
-            self._records.append(record.copy())
-            self._record_count += 1
-            return FlextResult[None].ok(None)
-        except (RuntimeError, ValueError, TypeError) as e:
-            return FlextResult[None].fail(f"Failed to buffer record: {e}")
+            block = self._encode_record(record)
+        except (FlextTargetLdifWriterError, RuntimeError, ValueError, TypeError) as e:
+            return FlextResult[None].fail(f"Failed to write record: {e}")
+        try:
+            self._open_handle().write(block)
+        except (OSError, RuntimeError, ValueError, TypeError) as e:
+            return FlextResult[None].fail(f"Failed to write record: {e}")
+        self._record_count += 1
+        return FlextResult[None].ok(None)
+
+    def write_records(self, records: Iterable[dict[str, object]]) -> FlextResult[int]:
+        """Encode and write a batch of records to the LDIF file.
+
+        Records that cannot be rendered (e.g. missing DN fields) are logged
+        and skipped; the batch fails only if the file cannot be written.
+        A single result carrying the number of records written is returned
+        for the whole batch.
+        """
+        try:
+            write = self._open_handle().write
+        except (OSError, RuntimeError, ValueError, TypeError) as e:
+            return FlextResult[int].fail(f"Failed to open LDIF file: {e}")
+        encode = self._encode_record
+        written = 0
+        try:
+            for record in records:
+                try:
+                    block = encode(record)
+                except (
+                    FlextTargetLdifWriterError,
+                    RuntimeError,
+                    ValueError,
+                    TypeError,
+                ) as e:
+                    logger.warning("Skipping invalid record: %s", e)
+                    continue
+                write(block)
+                written += 1
+        except (OSError, ValueError) as e:
+            return FlextResult[int].fail(f"Failed to write records: {e}")
+        finally:
+            self._record_count += written
+        return FlextResult[int].ok(written)
+
+    def _write_attribute(self, attr: str, value: object) -> None:
+        """Write a single attribute line to the output file."""
+        buf = bytearray()
+        self._append_attribute(buf, attr.encode("utf-8"), value)
+        self._open_handle().write(buf)
+
+    def _write_line(self, line: str) -> None:
+        """Write a raw line to the output file, folded as in RFC 2849."""
+        buf = bytearray(line.encode("utf-8"))
+        if len(buf) > self.line_length:
+            self._fold_tail(buf, 0)
+        buf += b"\n"
+        self._open_handle().write(buf)
+
+    def _format_header(self) -> str:
+        """Render the LDIF version line and optional generation timestamp."""
+        if not self.include_timestamps:
+            return "version: 1\n\n"
+        generated_on = time.strftime("%Y-%m-%dT%H:%M:%S")
+        return f"version: 1\n# Generated on: {generated_on}\n\n"
+
+    def _encode_record(self, record: dict[str, object]) -> bytearray:
+        """Encode a record as an LDIF entry block in a single pass.
+
+        Attribute mapping, value formatting and line folding happen per
+        field as it is visited. The block is built in the writer's reusable
+        buffer, which stays valid until the next call.
+        """
+        buf = self._buf
+        del buf[:]
+        append = self._append_attribute
+        attr_names = self._attr_names
+        append(buf, b"dn", self._generate_dn(record))
+        for key, value in record.items():
+            if key == "dn":  # Skip DN as it's already set
+                continue
+            attr = attr_names.get(key)
+            if attr is None:
+                mapped = self.attribute_mapping.get(key, key)
+                attr = attr_names[key] = mapped.encode("utf-8")
+            if isinstance(value, list):
+                for item in value:
+                    append(buf, attr, item)
+            else:
+                append(buf, attr, value)
+        buf += b"\n"  # Blank line between entries
+        return buf
+
+    def _append_attribute(self, buf: bytearray, attr: bytes, value: object) -> None:
+        """Append ``attr: value`` to ``buf``, or ``attr:: <base64>`` when needed.
+
+        The value is encoded to UTF-8 once and base64 works on those bytes
+        directly. ``None`` values produce no line.
+        """
+        value_type = type(value)
+        if value_type is str:
+            data = value.encode("utf-8")
+            unsafe = self.base64_encode or self._needs_base64_encoding_bytes(data)
+        elif value_type is int or value_type is bool:
+            # Integers and booleans always render as SAFE-STRINGs
+            data = str(value).encode("ascii")
+            unsafe = self.base64_encode
+        elif value is None:
+            return
+        else:
+            data = str(value).encode("utf-8")
+            unsafe = self.base64_encode or self._needs_base64_encoding_bytes(data)
+        start = len(buf)
+        buf += attr
+        if unsafe:
+            buf += b":: "
+            buf += binascii.b2a_base64(data, newline=False)
+        else:
+            buf += b": "
+            buf += data
+        if len(buf) - start > self.line_length:
+            self._fold_tail(buf, start)
+        buf += b"\n"
+
+    @staticmethod
+    def _needs_base64_encoding(value: str) -> bool:
+        """Check whether a value is not an RFC 2849 SAFE-STRING."""
+        return LdifWriter._needs_base64_encoding_bytes(value.encode("utf-8"))
+
+    @staticmethod
+    def _needs_base64_encoding_bytes(data: bytes) -> bool:
+        """Check whether UTF-8 encoded value bytes are not a SAFE-STRING."""
+        if not data:
+            return False
+        if data[0] in _UNSAFE_FIRST_BYTES or data[-1] == 0x20:
+            return True
+        return _UNSAFE_VALUE_RE.search(data) is not None
+
+    def _fold_tail(self, buf: bytearray, start: int) -> None:
+        """Fold the line starting at ``start`` in ``buf`` as in RFC 2849.
+
+        Folding counts octets, and continuation lines start with a single
+        space, so each one carries ``line_length - 1`` octets of the line.
+        The line is copied out once; chunks are appended from a view of it.
+        """
+        width = self.line_length
+        step = width - 1
+        line = buf[start:]
+        del buf[start + width :]
+        with memoryview(line) as view:
+            for i in range(width, len(line), step):
+                buf += b"\n "
+                buf += view[i : i + step]
 
     def _generate_dn(self, record: dict[str, object]) -> str:
-        """Generate DN from record using template."""
+        """Generate DN from record using the pre-parsed template."""
         try:
-            return self.dn_template.format(**record)
+            return render_dn(self._dn_segments, record)
         except KeyError as e:
-            msg: str = f"Missing required field for DN generation: {e}"
+            msg: str = f"Missing required field for DN generation: {e.args[0]!r}"
             raise FlextTargetLdifWriterError(msg) from e
 
     @property
@@ -0,0 +1,97 @@
+"""Tests for FlextTargetLdifConfig.
+
+Copyright (c) 2025 Flext. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from flext_target_ldif import (
+    FlextTargetLdifConfig,
+    FlextTargetLdifWriterError,
+    LdifWriter,
+)
+
+
+class TestFlextTargetLdifConfig:
+    """Test FlextTargetLdifConfig construction."""
+
+    def test_config_from_trusted_round_trip(self, temp_dir: Path) -> None:
+        """Test rebuilding a validated config without re-running validators."""
+        config = FlextTargetLdifConfig(
+            output_path=str(temp_dir),
+            dn_template="uid={uid},ou=users,dc=example,dc=com",
+        )
+
+        rebuilt = FlextTargetLdifConfig.from_trusted(config.model_dump())
+
+        assert rebuilt == config
+
+    def test_ldif_options_keep_unknown_keys(self, temp_dir: Path) -> None:
+        """Test user-supplied LDIF options beyond the typed ones are kept."""
+        config = FlextTargetLdifConfig(
+            output_path=str(temp_dir),
+            dn_template="uid={uid},ou=users,dc=example,dc=com",
+            ldif_options={"line_length": 100, "sort_attributes": True},
+        )
+
+        assert config.ldif_options == {"line_length": 100, "sort_attributes": True}
+
+    def test_default_ldif_options_not_shared(self, temp_dir: Path) -> None:
+        """Test each config gets its own copy of the default LDIF options."""
+        first = FlextTargetLdifConfig(
+            output_path=str(temp_dir),
+            dn_template="uid={uid},ou=users,dc=example,dc=com",
+        )
+        first.ldif_options["line_length"] = 40
+
+        second = FlextTargetLdifConfig(
+            output_path=str(temp_dir),
+            dn_template="uid={uid},ou=users,dc=example,dc=com",
+        )
+
+        assert second.ldif_options["line_length"] == 78
+
+    def test_business_rules_recreate_removed_output_path(self, temp_dir: Path) -> None:
+        """Test validate_business_rules recreates a removed output directory."""
+        output_path = temp_dir / "out"
+        config = FlextTargetLdifConfig(
+            output_path=str(output_path),
+            dn_template="uid={uid},ou=users,dc=example,dc=com",
+        )
+        output_path.rmdir()
+
+        result = config.validate_business_rules()
+
+        assert result.success
+        assert output_path.is_dir()
+
+    @pytest.mark.parametrize(
+        ("dn_template", "valid"),
+        [
+            ("uid={uid!s},employeeNumber={num:04d}", True),
+            ("uid={uid!x},ou=users", False),
+            ("uid={uid,ou=users", False),
+        ],
+    )
+    def test_business_rules_match_writer_dn_parsing(
+        self,
+        temp_dir: Path,
+        dn_template: str,
+        valid: bool,
+    ) -> None:
+        """Test the config accepts exactly the DN templates the writer accepts."""
+        config = FlextTargetLdifConfig.from_trusted(
+            {"output_path": str(temp_dir), "dn_template": dn_template},
+        )
+
+        assert config.validate_business_rules().success is valid
+        if valid:
+            LdifWriter(dn_template=dn_template)
+        else:
+            with pytest.raises(FlextTargetLdifWriterError):
+                LdifWriter(dn_template=dn_template)
@@ -0,0 +1,86 @@
+"""Tests for TargetLDIF sink creation and the LDIFSink write path.
+
+Copyright (c) 2025 Flext. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from flext_core import FlextResult
+
+from flext_target_ldif import LDIFSink, TargetLDIF
+
+EXPECTED_RECORD_COUNT = 2
+
+
+class TestTargetLDIFSinks:
+    """Test TargetLDIF sink management."""
+
+    def test_target_ldif_output_directory_creation(self, temp_dir: Path) -> None:
+        """Test target creates output directory on first sink."""
+        output_path = temp_dir / "new_directory"
+        config: dict[str, object] = {"output_path": str(output_path)}
+
+        # Directory is created when the first sink is requested
+        target = TargetLDIF(config=config)
+        assert not output_path.exists()
+        target.get_sink("users", {})
+        assert output_path.is_dir()
+
+
+class TestLDIFSink:
+    """Test LDIFSink record queueing and cleanup."""
+
+    def test_records_written_on_batch(self, sample_config: dict[str, object]) -> None:
+        """Test queued records are written to the stream file by process_batch."""
+        sink = LDIFSink(target_config=sample_config, stream_name="users", schema={})
+
+        sink.process_record({"uid": "jdoe", "cn": "John Doe"}, {})
+        sink.process_record({"uid": "jsmith", "cn": "Jane Smith"}, {})
+        sink.process_batch({})
+        sink.clean_up()
+
+        content = sink._get_output_file().read_text(encoding="utf-8")
+        assert content.count("dn: ") == EXPECTED_RECORD_COUNT
+        assert "dn: uid=jdoe,ou=users,dc=example,dc=com" in content
+        assert sink.ldif_writer.record_count == EXPECTED_RECORD_COUNT
+
+    def test_clean_up_flushes_pending_records(
+        self,
+        sample_config: dict[str, object],
+    ) -> None:
+        """Test records queued after the last batch are written by clean_up."""
+        sink = LDIFSink(target_config=sample_config, stream_name="users", schema={})
+
+        sink.process_record({"uid": "jdoe", "cn": "John Doe"}, {})
+        sink.clean_up()
+
+        content = sink._get_output_file().read_text(encoding="utf-8")
+        assert "dn: uid=jdoe,ou=users,dc=example,dc=com" in content
+
+    def test_clean_up_closes_writer_when_flush_fails(
+        self,
+        sample_config: dict[str, object],
+    ) -> None:
+        """Test the writer is closed even if the final flush fails."""
+        sink = LDIFSink(target_config=sample_config, stream_name="users", schema={})
+        sink.process_record({"uid": "jdoe", "cn": "John Doe"}, {})
+        sink.process_batch({})
+        writer = sink.ldif_writer
+        sink.process_record({"uid": "jsmith", "cn": "Jane Smith"}, {})
+
+        with (
+            patch.object(
+                writer,
+                "write_records",
+                return_value=FlextResult[int].fail("disk full"),
+            ),
+            pytest.raises(RuntimeError, match="Failed to write LDIF records"),
+        ):
+            sink.clean_up()
+
+        assert writer._file_handle is None
@@ -256,20 +256,6 @@ class TestTargetLDIF:
                 msg,
             )
 
-    def test_target_ldif_output_directory_creation(self) -> None:
-        """Test target creates output directory."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_path = Path(tmp_dir) / "new_directory"
-            config = {"output_path": str(output_path)}
-
-            # Directory should not exist initially
-            assert not output_path.exists()
-
-            # Creating target should create directory
-            TargetLDIF(config=config)
-            assert output_path.exists()
-            assert output_path.is_dir()
-
     def test_target_ldif_cli_method(self) -> None:
         """Test CLI method exists."""
         target = TargetLDIF()
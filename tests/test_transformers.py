@@ -0,0 +1,106 @@
+"""Tests for RecordTransformer.
+
+Copyright (c) 2025 Flext. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from flext_target_ldif import RecordTransformer, transform_phone, transform_timestamp
+
+
+class TestRecordTransformer:
+    """Test RecordTransformer record building."""
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            {"user_id": "jdoe", "first_name": "john", "last_name": "doe"},
+            {"uid": "jdoe", "display_name": "John Doe", "email": " JDoe@Example.com "},
+            {"uid": "jdoe", "phone": "+1 (555) 123-4567 ext", "notes": None},
+            {"cn": "jane smith", "objectClass": "person", "is_active": "yes"},
+            {},
+        ],
+    )
+    def test_build_ldap_record_matches_two_step(
+        self, record: dict[str, object]
+    ) -> None:
+        """Test build_ldap_record equals add_required_attributes(transform_record)."""
+        transformer = RecordTransformer(
+            attribute_mapping={
+                "user_id": "uid",
+                "first_name": "givenname",
+                "last_name": "sn",
+                "objectClass": "objectclass",
+            },
+        )
+
+        expected = transformer.add_required_attributes(
+            transformer.transform_record(record),
+        )
+
+        assert transformer.build_ldap_record(record) == expected
+
+    def test_add_required_attributes_does_not_modify_input(self) -> None:
+        """Test add_required_attributes returns a completed copy."""
+        transformer = RecordTransformer()
+        record = {"uid": "jdoe"}
+
+        result = transformer.add_required_attributes(record)
+
+        assert record == {"uid": "jdoe"}
+        assert result == {
+            "uid": "jdoe",
+            "objectclass": ["inetOrgPerson", "person"],
+            "cn": "jdoe",
+            "sn": "jdoe",
+        }
+
+    def test_mapping_is_copied_and_read_only(self) -> None:
+        """Test later changes to the caller's mapping do not affect the transformer."""
+        mapping = {"user_id": "uid"}
+        transformer = RecordTransformer(attribute_mapping=mapping)
+        mapping["user_id"] = "cn"
+
+        assert transformer.transform_record({"user_id": "jdoe"}) == {"uid": "jdoe"}
+        with pytest.raises(TypeError):
+            transformer.attribute_mapping["user_id"] = "cn"  # type: ignore[index]
+
+
+class TestTransformPhone:
+    """Test phone number filtering."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "+1 (555) 123-4567 ext. 9",
+            "tel: 555²³¹-12",
+            "፩፰፱ / ١٢",
+            "",
+        ],
+    )
+    def test_transform_phone_keeps_isdigit_characters(self, value: str) -> None:
+        """Test the filter keeps exactly str.isdigit() and formatting characters."""
+        expected = "".join(c for c in value if c.isdigit() or c in "+- ()")
+
+        assert transform_phone(value) == expected
+
+
+class TestTransformTimestamp:
+    """Test timestamp normalization."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2024-01-02T03:04:05+02:00", "2024-01-02T03:04:05+02:00"),
+            ("2024-01-02T03:04:05-05:30", "2024-01-02T03:04:05-05:30"),
+            ("2024-01-02T03:04:05Z", "2024-01-02T03:04:05+00:00"),
+            ("2024-01-02T03:04:05", "2024-01-02T03:04:05+00:00"),
+            ("not a date", "not a date"),
+        ],
+    )
+    def test_transform_timestamp(self, value: str, expected: str) -> None:
+        """Test values with an offset are kept and others normalized to UTC."""
+        assert transform_timestamp(value) == expected
@@ -9,6 +9,7 @@ REFACTORED: Complete writer system with 100% coverage and validation.
 from __future__ import annotations
 
 import base64
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -16,6 +17,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from flext_target_ldif import FlextTargetLdifWriterError, LdifWriter
+from flext_target_ldif.writer import DEFAULT_BUFFER_SIZE
 
 # Constants
 EXPECTED_BULK_SIZE = 2
@@ -100,6 +102,14 @@ class TestLdifWriterInitialization:
                 msg: str = f"Expected {Path(test_file)}, got {writer.output_file}"
                 raise AssertionError(msg)
 
+    def test_init_buffer_size(self) -> None:
+        """Test buffer size option and fallback for invalid values."""
+        writer = LdifWriter(ldif_options={"buffer_size": 1024})
+        assert writer.buffer_size == 1024
+
+        writer = LdifWriter(ldif_options={"buffer_size": 0})
+        assert writer.buffer_size == DEFAULT_BUFFER_SIZE
+
 
 class TestLdifWriterFileOperations:
     """Test file operations (open/close)."""
@@ -165,7 +175,7 @@ class TestLdifWriterFileOperations:
     def test_close_failure(self, mock_open_method: Mock) -> None:
         """Test file closing failure."""
         mock_file = Mock()
-        mock_file.close.side_effect = Exception("Close failed")
+        mock_file.close.side_effect = OSError("Close failed")
         mock_open_method.return_value = mock_file
 
         writer = LdifWriter()
@@ -179,6 +189,35 @@ class TestLdifWriterFileOperations:
                 msg,
             )
 
+    def test_open_recreates_removed_directory(self, tmp_path: Path) -> None:
+        """Test a removed output directory is recreated by a new writer."""
+        output_file = tmp_path / "out" / "users.ldif"
+        assert LdifWriter(output_file=output_file).open().success
+        shutil.rmtree(output_file.parent)
+
+        writer = LdifWriter(output_file=output_file)
+        result = writer.open()
+        writer.close()
+
+        assert result.success
+        assert output_file.exists()
+
+    def test_write_after_close_appends(self, tmp_path: Path) -> None:
+        """Test records written after close() are appended, not truncated."""
+        output_file = tmp_path / "reopen.ldif"
+        writer = LdifWriter(output_file=output_file)
+
+        assert writer.write_record({"uid": "first", "cn": "First"}).success
+        assert writer.close().success
+        assert writer.write_records([{"uid": "second", "cn": "Second"}]).success
+        assert writer.close().success
+
+        content = output_file.read_text(encoding="utf-8")
+        assert content.count("version: 1") == 1
+        assert "dn: uid=first,ou=users,dc=example,dc=com" in content
+        assert "dn: uid=second,ou=users,dc=example,dc=com" in content
+        assert writer.record_count == EXPECTED_BULK_SIZE
+
 
 class TestLdifWriterRecordWriting:
     """Test record writing functionality."""
@@ -327,6 +366,28 @@ class TestLdifWriterRecordWriting:
 
         tmp_path.unlink()
 
+    def test_write_records_batch(self, tmp_path: Path) -> None:
+        """Test writing a batch of records in one call."""
+        output_file = tmp_path / "batch.ldif"
+        writer = LdifWriter(output_file=output_file)
+        records = [
+            {"uid": "jdoe", "cn": "John Doe"},
+            {"cn": "No Uid"},
+            {"uid": "jsmith", "cn": "Jane Smith"},
+            {"uid": "bob", "cn": "Bob Wilson"},
+        ]
+
+        result = writer.write_records(records)
+        writer.close()
+
+        # The record without a DN field is skipped
+        assert result.success
+        assert result.data == EXPECTED_DATA_COUNT
+        assert writer.record_count == EXPECTED_DATA_COUNT
+        content = output_file.read_text(encoding="utf-8")
+        assert content.count("dn: ") == EXPECTED_DATA_COUNT
+        assert "No Uid" not in content
+
 
 class TestLdifWriterBase64Encoding:
     """Test base64 encoding functionality."""
@@ -403,6 +464,22 @@ class TestLdifWriterBase64Encoding:
 
         tmp_path.unlink()
 
+    def test_append_attribute_base64_round_trip(self) -> None:
+        """Test unsafe values are rendered as decodable base64 lines."""
+        writer = LdifWriter()
+        buf = bytearray()
+
+        writer._append_attribute(buf, b"cn", "José")
+
+        line = bytes(buf).decode("ascii").rstrip("\n")
+        assert line.startswith("cn:: ")
+        assert base64.b64decode(line[len("cn:: ") :]).decode("utf-8") == "José"
+
+        buf.clear()
+        writer._append_attribute(buf, b"uid", "jdoe")
+        writer._append_attribute(buf, b"mail", None)
+        assert bytes(buf) == b"uid: jdoe\n"
+
     def test_force_base64_encoding(self) -> None:
         """Test forcing base64 encoding via options."""
         with tempfile.NamedTemporaryFile(
@@ -507,6 +584,18 @@ class TestLdifWriterLineWrapping:
             msg: str = f"Expected {100}, got {writer.line_length}"
             raise AssertionError(msg)
 
+    def test_long_attribute_fold_round_trip(self) -> None:
+        """Test folded lines respect the width and unfold to the original."""
+        writer = LdifWriter(ldif_options={"line_length": 20})
+        buf = bytearray()
+
+        writer._append_attribute(buf, b"description", "x" * 100)
+
+        folded = bytes(buf).decode("utf-8")
+        assert folded.endswith("\n")
+        assert all(len(line) <= 20 for line in folded[:-1].split("\n"))
+        assert folded[:-1].replace("\n ", "") == "description: " + "x" * 100
+
 
 class TestLdifWriterDnGeneration:
     """Test DN generation functionality."""
@@ -551,6 +640,24 @@ class TestLdifWriterDnGeneration:
                 msg,
             )
 
+    def test_dn_template_format_spec(self) -> None:
+        """Test format specs and conversions in the DN template are honoured."""
+        writer = LdifWriter(dn_template="uid={uid!s},employeeNumber={num:04d}")
+
+        dn = writer._generate_dn({"uid": "jdoe", "num": 7})
+
+        assert dn == "uid=jdoe,employeeNumber=0007"
+
+    def test_invalid_dn_template(self) -> None:
+        """Test a malformed DN template is rejected at construction."""
+        with pytest.raises(FlextTargetLdifWriterError, match="Invalid DN template"):
+            LdifWriter(dn_template="uid={uid,ou=users")
+
+    def test_unknown_dn_template_conversion(self) -> None:
+        """Test an unknown conversion flag is rejected at construction."""
+        with pytest.raises(FlextTargetLdifWriterError, match="Invalid DN template"):
+            LdifWriter(dn_template="uid={uid!x},ou=users")
+
 
 class TestLdifWriterContextManager:
     """Test context manager functionality."""